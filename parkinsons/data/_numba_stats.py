@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.19                                                                              #
+# Python     : 3.10.10                                                                             #
+# Filename   : /parkinsons/data/_numba_stats.py                                                    #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Thursday October 15th 2026 09:12:40 am                                              #
+# Modified   : Thursday October 15th 2026 09:12:40 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Numba Kernels for Descriptive Statistics"""
+import numpy as np
+from numba import njit, prange
+
+# Fast-math flags excluding 'nnan' and 'ninf', which would let the compiler drop the NaN filter.
+FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+# ------------------------------------------------------------------------------------------------ #
+@njit(parallel=True, fastmath=FASTMATH, cache=True)
+def describe(a: np.ndarray, q: np.ndarray) -> np.ndarray:  # pragma: no cover
+    """Computes count, mean, std, min, quantiles and max for each row of a 2D array.
+
+    Each row holds the values of one column. Rows are processed in parallel, each in a single
+    Welford pass for count, mean, standard deviation, min and max, followed by a selection-based
+    quantile computation. NaNs are excluded, as in pandas.
+
+    Args:
+        a (np.ndarray): Float64 array of shape (columns, observations).
+        q (np.ndarray): Quantiles to compute, in [0, 1].
+
+    Returns:
+        Float64 array of shape (columns, 5 + len(q)) ordered as count, mean, std, min, the
+        quantiles, then max.
+    """
+    end = 4 + q.shape[0]
+    out = np.full((a.shape[0], end + 1), np.nan)
+    for j in prange(a.shape[0]):
+        row = a[j]
+        values = row[~np.isnan(row)]
+        n = values.shape[0]
+        out[j, 0] = n
+        if n == 0:
+            continue
+        mean = 0.0
+        m2 = 0.0
+        lo = values[0]
+        hi = values[0]
+        for i in range(n):
+            x = values[i]
+            delta = x - mean
+            mean += delta / (i + 1)
+            m2 += delta * (x - mean)
+            lo = min(lo, x)
+            hi = max(hi, x)
+        out[j, 1] = mean
+        if n > 1:
+            out[j, 2] = np.sqrt(m2 / (n - 1))
+        out[j, 3] = lo
+        out[j, 4:end] = np.quantile(values, q)
+        out[j, end] = hi
+    return out
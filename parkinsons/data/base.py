@@ -16,20 +16,95 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
+from __future__ import annotations
 from abc import ABC
+from importlib.util import find_spec
 import logging
+from typing import TYPE_CHECKING, Callable
 
+import numpy as np
 import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
 
-from parkinsons.data.visual import Palette, Config, Canvas
+from parkinsons.data.visual import Palette, Canvas, ensure_visual, label_bars
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+# Optional parsers are detected without importing them, keeping them off the import path.
+CSV_ENGINE = "pyarrow" if find_spec("pyarrow") is not None else "c"
+HAS_POLARS = find_spec("polars") is not None
+
+# ------------------------------------------------------------------------------------------------ #
+PERCENTILES = np.array([0.05, 0.25, 0.5, 0.75, 0.95], dtype=np.float64)
+STATISTICS = ["count", "mean", "std", "min"] + [f"{p:.0%}" for p in PERCENTILES] + ["max"]
+FAST_DESCRIBE_ROWS = 100_000  # Row count above which describe uses partial sorts for percentiles.
+USE_POLARS_IO = True  # Parse csv files with polars when it is installed.
+ENGINES = ("pandas", "numba")  # Engines supported by Dataset.describe.
+CATEGORICAL_RATIO = 0.1  # Unique-to-row ratio below which inferred string columns become category.
+# Tokens read as missing values, matching the pandas csv reader defaults.
+NA_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+
+
+# ------------------------------------------------------------------------------------------------ #
+def _fast_describe(df: pd.DataFrame) -> pd.DataFrame:
+    """Produces descriptive statistics for numeric columns, selecting percentiles by partial sort.
+
+    np.partition places the order statistics needed for each percentile in linear time, whereas
+    pandas fully sorts each column. Percentiles use linear interpolation, as in pandas.
+
+    Args:
+        df (pd.DataFrame): DataFrame containing numeric columns only.
+    """
+    rows = {}
+    for name, series in df.items():
+        a = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        a = a[~np.isnan(a)]  # Boolean indexing copies, so partitioning leaves the frame intact.
+        n = a.size
+        if n == 0:
+            rows[name] = [0.0] + [np.nan] * (len(STATISTICS) - 1)
+            continue
+        positions = PERCENTILES * (n - 1)
+        lower = np.floor(positions).astype(np.int64)
+        upper = np.minimum(lower + 1, n - 1)
+        a.partition(np.unique(np.concatenate([[0, n - 1], lower, upper])))
+        quantiles = a[lower] + (a[upper] - a[lower]) * (positions - lower)
+        std = a.std(ddof=1) if n > 1 else np.nan
+        rows[name] = [float(n), a.mean(), std, a[0], *quantiles, a[n - 1]]
+    return pd.DataFrame.from_dict(rows, orient="index", columns=STATISTICS)
 
-sns.set_style(Config.style)
-sns.set_palette = sns.dark_palette(Palette.blue, reverse=True, as_cmap=True)
 
 # ------------------------------------------------------------------------------------------------ #
-PERCENTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
+def _average(description: pd.DataFrame) -> pd.DataFrame:
+    """Summarizes descriptive statistics as 'mean \u00B1 std', rounded to one decimal place.
+
+    Args:
+        description (pd.DataFrame): Descriptive statistics with 'mean' and 'std' columns.
+    """
+    mean = description["mean"].round(1).to_numpy().astype(str)
+    std = description["std"].round(1).to_numpy().astype(str)
+    return pd.DataFrame(
+        {"Average": [f"{m} \u00B1 {s}" for m, s in zip(mean, std)]}, index=description.index
+    )
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -42,26 +117,148 @@ class Dataset(ABC):
         filepath (str): Path to metadata file
     """
 
+    DTYPES = {}  # Column dtypes declared by subclasses, passed through to the csv reader.
+    CATEGORICAL_COLS = None  # Columns cast to category on load. None infers low-cardinality ones.
+
     def __init__(self, name: str, filepath: str) -> None:
         self._name = name
         self._filepath = filepath
-        self._df = pd.read_csv(self._filepath)
-        self._info = None
+        self._version = 0
+        self._df = self._read_csv(self._filepath)
+        self._cache = {}
+        self._fingerprint = None
         self._logger = logging.getLogger(f"{self.__class__.__name__}")
 
+    @property
+    def _df(self) -> pd.DataFrame:
+        return self._data
+
+    @_df.setter
+    def _df(self, df: pd.DataFrame) -> None:
+        """Replaces the data, bumping the version that the cached results are checked against."""
+        self._data = df
+        self._version += 1
+
+    @classmethod
+    def _read_csv(cls, filepath: str) -> pd.DataFrame:
+        """Reads the csv file using the multithreaded polars or pyarrow parser when available.
+
+        Low-cardinality string columns are cast to category so that grouping and counting operate
+        on integer codes rather than hashing Python strings, and integer columns are downcast.
+
+        Args:
+            filepath (str): Path to the csv file.
+        """
+        if USE_POLARS_IO and HAS_POLARS and CSV_ENGINE == "pyarrow":
+            import polars as pl
+
+            # Conversion to pandas goes through Arrow, so polars is used only with pyarrow. Types
+            # are inferred over the full file, as pandas does, rather than the first 100 rows.
+            df = pl.read_csv(filepath, infer_schema_length=None, null_values=NA_VALUES).to_pandas()
+            df = df.astype({col: dtype for col, dtype in cls.DTYPES.items() if col in df})
+        else:
+            df = pd.read_csv(filepath, engine=CSV_ENGINE, dtype=cls.DTYPES or None)
+        columns = cls.CATEGORICAL_COLS
+        if columns is None:
+            # Identifier-like columns gain nothing as categories, so only repetitive ones are cast.
+            columns = [
+                column
+                for column in df.select_dtypes(include=["object", "string"]).columns
+                if df[column].nunique() < CATEGORICAL_RATIO * len(df)
+            ]
+        for column in columns:
+            df[column] = df[column].astype("category")
+        return cls._downcast(df)
+
+    @classmethod
+    def _downcast(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """Downcasts 64-bit integer columns not declared in DTYPES to int32 when they fit.
+
+        Narrower integer types are not used, since arithmetic on them wraps around at values
+        users routinely compute, such as twice an age. Floats are kept at full precision, as
+        pandas computes statistics of float32 columns in float32.
+
+        Args:
+            df (pd.DataFrame): DataFrame read from the csv file.
+        """
+        bounds = np.iinfo(np.int32)
+        for column in df.select_dtypes(include="number").columns.difference(list(cls.DTYPES)):
+            series = df[column]
+            if not pd.api.types.is_integer_dtype(series) or series.dtype.itemsize <= 4:
+                continue
+            if series.empty or (series.min() >= bounds.min and series.max() <= bounds.max):
+                df[column] = series.astype(np.int32)
+        return df
+
+    def reset(self) -> None:
+        """Clears cached statistics so that they are recomputed from the current data.
+
+        Replacing the frame or changing its shape or dtypes is detected automatically. Values
+        modified in place are not, and require a call to reset.
+        """
+        self._cache = {}
+        self._fingerprint = None
+
+    def _refresh(self) -> None:
+        """Resets cached state when the data fingerprint (version, shape and dtypes) changes."""
+        fingerprint = (self._version, self._df.shape, tuple(map(str, self._df.dtypes)))
+        if fingerprint != self._fingerprint:
+            self.reset()
+            self._fingerprint = fingerprint
+
+    def _cached(self, key: tuple, compute: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """Returns the cached result for key, computing and storing it on first use.
+
+        The cache is cleared whenever the fingerprint of the data changes, so replacing the frame
+        or adding columns does not serve stale results. A copy is returned, so that callers
+        modifying the result do not alter the cache.
+
+        Args:
+            key (tuple): The method name followed by its arguments. List arguments, such as
+                several grouping columns, are converted to tuples so that the key is hashable.
+            compute (Callable): Computes the result on a cache miss.
+        """
+        key = tuple(tuple(arg) if isinstance(arg, list) else arg for arg in key)
+        self._refresh()
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key].copy()
+
     def info(self) -> pd.DataFrame:
         """Returns a DataFrame with basic dataset statistics"""
+        return self._cached(("info",), self._info_table)
 
-        info = self._df.dtypes.to_frame().reset_index()
-        info.columns = ["Column", "Dtype"]
-        info["Valid"] = self._df.count().values
-        info["Null"] = self._df.isna().sum().values
-        info["Validity"] = info["Valid"] / self._df.shape[0]
-        info["Unique"] = self._df.nunique().values
-        info["Cardinality"] = info["Unique"] / self._df.shape[0]
-        info["Size"] = self._df.memory_usage(deep=True, index=False).to_frame().reset_index()[0]
-        info = round(info, 2)
-        return info
+    def _info_table(self) -> pd.DataFrame:
+        n = self._df.shape[0]
+        records = []
+        # A single pass per column: the null mask is computed once and reused for both the
+        # valid count and the unique count of the non-null values. The mask is taken from the
+        # series so that categorical codes and extension-array validity bitmaps are used directly.
+        for name, series in self._df.items():
+            null = series.isna().to_numpy()
+            nulls = int(null.sum())
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                # Hash the integer codes rather than the category values.
+                a = series.cat.codes.to_numpy()
+            else:
+                a = series.to_numpy()
+            records.append((name, series.dtype, n - nulls, nulls, pd.unique(a[~null]).size))
+        info = pd.DataFrame.from_records(
+            records, columns=["Column", "Dtype", "Valid", "Null", "Unique"]
+        )
+        info.insert(4, "Validity", info["Valid"] / n)
+        info["Cardinality"] = info["Unique"] / n
+        info["Size"] = self._df.memory_usage(deep=True, index=False).to_numpy()
+        return info.round(2).astype(
+            {
+                "Valid": "int32",
+                "Null": "int32",
+                "Validity": "float32",
+                "Unique": "int32",
+                "Cardinality": "float32",
+                "Size": "int64",
+            }
+        )
 
     def head(self, n: int = 5) -> pd.DataFrame:
         return self._df.head(n)
@@ -99,12 +296,15 @@ class Dataset(ABC):
             ax (plt.axes): A matplotlib axes object.
 
         """
+        import seaborn as sns
+
+        ensure_visual()
         ax = ax or Canvas().ax
         title = title or x
         sns.countplot(
             data=self._df, x=x, y=y, hue=hue, orient=orient, palette=Palette.blues_r, ax=ax
         ).set(title=title)
-        ax.bar_label(ax.containers[0], label_type="edge")
+        label_bars(ax)
         return ax
 
     def histplot(
@@ -127,6 +327,9 @@ class Dataset(ABC):
             ax (plt.axes): A matplotlib axes object.
 
         """
+        import seaborn as sns
+
+        ensure_visual()
         if title is None:
             title = x if hue is None else x + " by " + hue
         ax = ax or Canvas().ax
@@ -155,6 +358,9 @@ class Dataset(ABC):
             ax (plt.axes): A matplotlib axes object.
 
         """
+        import seaborn as sns
+
+        ensure_visual()
         if title is None:
             title = x if hue is None else x + " by " + hue
         ax = ax or Canvas().ax
@@ -183,6 +389,9 @@ class Dataset(ABC):
             ax (plt.axes): A matplotlib axes object.
 
         """
+        import seaborn as sns
+
+        ensure_visual()
         if title is None:
             title = x if hue is None else x + " by " + hue
         ax = ax or Canvas().ax
@@ -191,43 +400,91 @@ class Dataset(ABC):
         ).set(title=title)
         return ax
 
-    def describe(self, column: str = None, verbose: bool = True) -> pd.DataFrame:
+    def describe(
+        self, column: str = None, verbose: bool = True, engine: str = "pandas"
+    ) -> pd.DataFrame:
         """Produces descriptive statistics
 
         Args:
             column (str): Optional column upon which descriptive statistics will be computed.
             verbose (bool): Optional. Whether to produce full (verbose) descriptive statistics, or abbreviated.
+            engine (str): Optional. Either 'pandas' or 'numba'. The numba engine computes all
+                statistics in a single compiled pass per column. Requires numba.
 
         """
-        if column is None:
-            description = self._df.describe(percentiles=PERCENTILES).T
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}'. Expected one of {ENGINES}.")
+        return self._cached(
+            ("describe", column, verbose, engine),
+            lambda: self._describe(column=column, verbose=verbose, engine=engine),
+        )
+
+    def _describe(self, column: str, verbose: bool, engine: str) -> pd.DataFrame:
+        df = self._df if column is None else self._df[[column]]
+        numeric = df.select_dtypes(include="number")
+        if not verbose:
+            # The abbreviated summary reports only the mean and standard deviation, so the
+            # extrema and percentiles are not computed.
+            description = numeric.agg(["mean", "std"]).T
+        elif numeric.shape[1] == 0:
+            # Non-numeric columns are summarized by pandas as count, unique, top and freq.
+            description = df.describe(percentiles=PERCENTILES).T
+        elif engine == "numba":
+            from parkinsons.data._numba_stats import describe
+
+            a = np.ascontiguousarray(numeric.to_numpy(dtype=np.float64, na_value=np.nan).T)
+            description = pd.DataFrame(
+                describe(a, PERCENTILES),
+                index=numeric.columns,
+                columns=STATISTICS,
+            )
+        elif numeric.shape[0] > FAST_DESCRIBE_ROWS:
+            description = _fast_describe(numeric)
         else:
-            description = self._df[column].describe(percentiles=PERCENTILES).to_frame().T
+            description = df.describe(percentiles=PERCENTILES).T
 
         if verbose:
             return description
         else:
-            desc = round(description[["mean", "std"]], 1)
-            desc["Average"] = (
-                desc["mean"].astype(str) + " " + "\u00B1" + " " + desc["std"].astype(str)
-            )
-            desc = desc["Average"].to_frame()
-            return desc
+            return _average(description)
 
     def describe_group(
         self, group_by: str, column: str = None, verbose: bool = True
     ) -> pd.DataFrame:
+        return self._cached(
+            ("describe_group", group_by, column, verbose),
+            lambda: self._describe_group(group_by=group_by, column=column, verbose=verbose),
+        )
+
+    def _describe_group(self, group_by: str, column: str, verbose: bool) -> pd.DataFrame:
+        groups = self._df.groupby(by=group_by, observed=True, sort=False)
         if column is None:
-            description = self._df.groupby(by=group_by).describe(percentiles=PERCENTILES).T
+            # Aggregate only the numeric columns rather than describing the whole frame.
+            keys = group_by if isinstance(group_by, (list, tuple)) else [group_by]
+            columns = self._df.select_dtypes(include="number").columns.difference(
+                keys, sort=False
+            )
+            grouped = groups[columns]
+            quantiles = grouped.quantile(PERCENTILES)
+            statistics = {
+                "count": grouped.count(),
+                "mean": grouped.mean(),
+                "std": grouped.std(),
+                "min": grouped.min(),
+            }
+            for p in PERCENTILES:
+                statistics[f"{p:.0%}"] = quantiles.xs(p, level=-1)
+            statistics["max"] = grouped.max()
+            description = (
+                pd.concat(statistics, axis=1)
+                .swaplevel(axis=1)
+                .reindex(columns=pd.MultiIndex.from_product([columns, STATISTICS]))
+                .T
+            )
         else:
-            description = self._df.groupby(by=group_by)[column].describe(percentiles=PERCENTILES)
+            description = groups[column].describe(percentiles=PERCENTILES)
 
         if verbose:
             return description
         else:
-            desc = round(description[["mean", "std"]], 1)
-            desc["Average"] = (
-                desc["mean"].astype(str) + " " + "\u00B1" + " " + desc["std"].astype(str)
-            )
-            desc = desc["Average"].to_frame()
-            return desc
+            return _average(description)
@@ -16,13 +16,36 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
-import seaborn as sns
+from __future__ import annotations
+from typing import TYPE_CHECKING
 
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
 from parkinsons.data.base import Dataset
-from parkinsons.data.visual import Canvas
+from parkinsons.data.visual import Canvas, Palette, ensure_visual
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+
+# ------------------------------------------------------------------------------------------------ #
+def _duration(df: pd.DataFrame, start: str, end: str) -> np.ndarray:
+    """Returns end minus start, subtracting the underlying arrays to bypass index alignment.
+
+    Integer columns yield an int64 result, so that narrow integer types cannot overflow. Float
+    columns are subtracted in at least float64, so that no precision is lost.
+
+    Args:
+        df (pd.DataFrame): DataFrame containing the start and end columns.
+        start (str): Name of the start column.
+        end (str): Name of the end column.
+    """
+    begin = df[start].to_numpy(copy=False)
+    finish = df[end].to_numpy(copy=False)
+    integral = np.issubdtype(begin.dtype, np.integer) and np.issubdtype(finish.dtype, np.integer)
+    dtype = np.int64 if integral else np.result_type(begin, finish, np.float64)
+    return np.subtract(finish, begin, dtype=dtype)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -31,13 +54,57 @@ from parkinsons.data.visual import Canvas
 class Subject(Dataset):
     def __init__(self, name: str, filepath: str) -> None:
         super().__init__(name=name, filepath=filepath)
-        self._updrs = pd.melt(
-            self._df[["Subject", "Visit", "Sex", "YearsSinceDx", "UPDRSIII_Off", "UPDRSIII_On"]],
-            id_vars=["Subject", "Visit", "Sex", "YearsSinceDx"],
-            value_vars=["UPDRSIII_Off", "UPDRSIII_On"],
-            var_name="Instrument",
-            value_name="Score",
-        )
+        self._updrs = None
+        self._updrs_by = None
+
+    @property
+    def updrs(self) -> pd.DataFrame:
+        """Returns the UPDRS III scores in long format, one row per visit and instrument.
+
+        The frame is built on first access, so callers that never use the UPDRS methods do not
+        pay for it, and rebuilt after the data changes.
+        """
+        self._refresh()
+        if self._updrs is None:
+            # Stack the off and on medication scores. Equivalent to pd.melt, without copying the
+            # score columns through the melt or repeating the instrument strings.
+            instruments = ["UPDRSIII_Off", "UPDRSIII_On"]
+            ids = self._df[["Subject", "Visit", "Sex", "YearsSinceDx"]]
+            updrs = pd.concat([ids, ids], ignore_index=True)
+            updrs["Instrument"] = pd.Categorical.from_codes(
+                np.repeat([0, 1], len(ids)), categories=instruments
+            )
+            updrs["Score"] = np.concatenate([self._df[col].to_numpy() for col in instruments])
+            self._updrs = updrs
+        return self._updrs
+
+    def reset(self) -> None:
+        """Clears cached statistics and the UPDRS frames derived from the current data."""
+        super().reset()
+        self._updrs = None
+        self._updrs_by = None
+
+    def _updrs_slice(self, filter_var: str, filter_val: str) -> pd.DataFrame:
+        """Returns the UPDRS scores where filter_var equals filter_val.
+
+        The scores are split once by sex and by instrument, with one groupby pass per variable,
+        and every group is kept for reuse until the data changes. Other filters fall back to a
+        boolean mask.
+
+        Args:
+            filter_var (str): The variable upon which the scores are filtered.
+            filter_val (str): The value of the filter variable to select.
+        """
+        self._refresh()
+        if self._updrs_by is None:
+            self._updrs_by = {
+                var: dict(list(self.updrs.groupby(var, observed=True, sort=False)))
+                for var in ("Sex", "Instrument")
+            }
+        updrs = self._updrs_by.get(filter_var, {}).get(filter_val)
+        if updrs is None:
+            updrs = self.updrs.loc[self.updrs[filter_var] == filter_val]
+        return updrs
 
     def histogram(
         self, x: str, grouping: str = None, title: str = None, ax: plt.axes = None
@@ -47,10 +114,13 @@ class Subject(Dataset):
         Args:
             ax (plt.axes): A matplotlib axes object
         """
+        import seaborn as sns
+
+        ensure_visual()
         ax = ax or Canvas().ax
 
         sns.histplot(
-            data=self._df, x=x, hue=grouping, multiple="stack", ax=ax, palette="Blues_r"
+            data=self._df, x=x, hue=grouping, multiple="stack", ax=ax, palette=Palette.blues_r
         ).set(title=title)
 
     def updrs_gender(self, ax: plt.axes = None) -> pd.DataFrame:
@@ -59,6 +129,9 @@ class Subject(Dataset):
         Args:
             ax (plt.axes): An matplotlib axes object.
         """
+        import seaborn as sns
+
+        ensure_visual()
         suptitle = "Unified Parkinson's Disease Rating Scale (UPDRS)"
         title_male = "Male Subjects"
         title_female = "Female Subjects"
@@ -69,10 +142,8 @@ class Subject(Dataset):
         axs = canvas.axs
         fig.suptitle(suptitle)
 
-        # Melt the dataframe by instrument, then extract, male and female datasets
-
-        male_dataset = self._updrs[self._updrs["Sex"] == "M"]
-        female_dataset = self._updrs[self._updrs["Sex"] == "F"]
+        male_dataset = self._updrs_slice("Sex", "M")
+        female_dataset = self._updrs_slice("Sex", "F")
         sns.histplot(data=female_dataset, x="Score", hue="Instrument", kde=True, ax=axs[0]).set(
             title=title_female
         )
@@ -87,6 +158,9 @@ class Subject(Dataset):
         Args:
             ax (plt.axes): An matplotlib axes object.
         """
+        import seaborn as sns
+
+        ensure_visual()
         suptitle = "Unified Parkinson's Disease Rating Scale (UPDRS)"
         title_off = "Off Medication"
         title_on = "On Medication"
@@ -97,8 +171,8 @@ class Subject(Dataset):
         axs = canvas.axs
         fig.suptitle(suptitle)
 
-        updrs_on = self._updrs[self._updrs["Instrument"] == "UPDRSIII_On"]
-        updrs_off = self._updrs[self._updrs["Instrument"] == "UPDRSIII_Off"]
+        updrs_on = self._updrs_slice("Instrument", "UPDRSIII_On")
+        updrs_off = self._updrs_slice("Instrument", "UPDRSIII_Off")
         sns.histplot(data=updrs_off, x="Score", hue="Sex", kde=True, ax=axs[0]).set(title=title_off)
         sns.histplot(data=updrs_on, x="Score", hue="Sex", kde=True, ax=axs[1]).set(title=title_on)
         fig.tight_layout()
@@ -110,10 +184,22 @@ class Subject(Dataset):
         filter_val: str = None,
         group_var: str = None,
     ) -> pd.DataFrame:
-        return (
-            self._updrs.loc[self._updrs[filter_var] == filter_val]
-            .groupby(by=group_var)[column]
-            .describe()
+        """Produces descriptive statistics of the UPDRS scores for a filtered subset.
+
+        Results are cached per argument set, so repeated summaries over the same slice are
+        computed once.
+
+        Args:
+            column (str): The column upon which descriptive statistics will be computed.
+            filter_var (str): The variable upon which the scores are filtered.
+            filter_val (str): The value of the filter variable to select.
+            group_var (str): The variable by which the statistics are grouped.
+        """
+        return self._cached(
+            ("describe_updrs", column, filter_var, filter_val, group_var),
+            lambda: self._updrs_slice(filter_var, filter_val)
+            .groupby(by=group_var, observed=True, sort=False)[column]
+            .describe(),
         )
 
 
@@ -121,9 +207,11 @@ class Subject(Dataset):
 #                                     EVENT METADATA                                               #
 # ------------------------------------------------------------------------------------------------ #
 class Event(Dataset):
+    CATEGORICAL_COLS = {"Type"}
+
     def __init__(self, name: str, filepath: str) -> None:
         super().__init__(name=name, filepath=filepath)
-        self._df["Duration"] = self._df["Completion"] - self._df["Init"]
+        self._df["Duration"] = _duration(self._df, start="Init", end="Completion")
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -132,13 +220,15 @@ class Event(Dataset):
 class Task(Dataset):
     def __init__(self, name: str, filepath: str) -> None:
         super().__init__(name=name, filepath=filepath)
-        self._df["Duration"] = self._df["End"] - self._df["Begin"]
+        self._df["Duration"] = _duration(self._df, start="Begin", end="End")
 
 
 # ------------------------------------------------------------------------------------------------ #
 #                                      TDCSFOG METADATA                                            #
 # ------------------------------------------------------------------------------------------------ #
 class TDCSFoG(Dataset):
+    DTYPES = {"Visit": "int32", "Test": "int32"}
+
     def __init__(self, name: str, filepath: str) -> None:
         super().__init__(name=name, filepath=filepath)
 
@@ -147,6 +237,8 @@ class TDCSFoG(Dataset):
 #                                       DEFOG METADATA                                             #
 # ------------------------------------------------------------------------------------------------ #
 class DeFOG(Dataset):
+    DTYPES = {"Visit": "int32"}
+
     def __init__(self, name: str, filepath: str) -> None:
         super().__init__(name=name, filepath=filepath)
 
@@ -17,17 +17,25 @@
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 """Visualization of Data Module"""
+from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import List
+from functools import lru_cache
+import math
+import sys
+from typing import TYPE_CHECKING, List
 
-import matplotlib.pyplot as plt
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+# Instance __slots__ for dataclasses are only supported from Python 3.10.
+SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 # ------------------------------------------------------------------------------------------------ #
 #                                            PALETTE                                               #
 # ------------------------------------------------------------------------------------------------ #
 
 
-@dataclass
+@dataclass(frozen=True)
 class Palette:
     blue: str = "#69d"
     blues: str = "Blues"
@@ -41,7 +49,7 @@ class Palette:
 # ------------------------------------------------------------------------------------------------ #
 #                                            CONFIG                                                #
 # ------------------------------------------------------------------------------------------------ #
-@dataclass
+@dataclass(frozen=True)
 class Config:
     style = "whitegrid"
     figsize = (12, 3)
@@ -52,19 +60,87 @@ class Config:
 # ------------------------------------------------------------------------------------------------ #
 
 
-@dataclass
+@dataclass(**SLOTS)
 class Canvas:
+    """Figure and axes for a grid of subplots, created on first access of fig, ax or axs."""
+
     nrows: int = 1
     ncols: int = 1
-    fig: plt.figure = None
-    ax: plt.axes = None
-    axs: List = field(default_factory=lambda: [plt.axes])
+    _fig: plt.figure = field(default=None, init=False, repr=False)
+    _ax: plt.axes = field(default=None, init=False, repr=False)
+    _axs: List = field(default_factory=list, init=False, repr=False)
+
+    @property
+    def fig(self) -> plt.figure:
+        self._subplots()
+        return self._fig
+
+    @property
+    def ax(self) -> plt.axes:
+        self._subplots()
+        return self._ax
+
+    @property
+    def axs(self) -> List:
+        self._subplots()
+        return self._axs
+
+    def _subplots(self) -> None:
+        if self._fig is not None:
+            return
+
+        import matplotlib.pyplot as plt
 
-    def __post_init__(self) -> None:
         if self.nrows > 1 or self.ncols > 1:
             figsize = []
             figsize.append(Config.figsize[0])
             figsize.append(Config.figsize[1] * self.nrows)
-            self.fig, self.axs = plt.subplots(self.nrows, self.ncols, figsize=figsize)
+            self._fig, self._axs = plt.subplots(self.nrows, self.ncols, figsize=figsize)
         else:
-            self.fig, self.ax = plt.subplots(self.nrows, self.ncols, figsize=Config.figsize)
+            self._fig, self._ax = plt.subplots(self.nrows, self.ncols, figsize=Config.figsize)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        VISUAL SETUP                                              #
+# ------------------------------------------------------------------------------------------------ #
+@lru_cache(maxsize=None)
+def ensure_visual() -> None:
+    """Applies the seaborn style and palette on first use by a plotting method.
+
+    Deferring this keeps matplotlib and seaborn out of the import path for callers that only
+    use the tabular methods.
+    """
+    import seaborn as sns
+
+    sns.set_style(Config.style)
+    sns.set_palette(sns.dark_palette(Palette.blue, reverse=True))
+
+
+# ------------------------------------------------------------------------------------------------ #
+def label_bars(ax: plt.axes) -> None:
+    """Labels each bar on the axes with its value.
+
+    Places the text directly at the end of each bar, avoiding the per-bar annotation and offset
+    layout performed by Axes.bar_label.
+
+    Args:
+        ax (plt.axes): A matplotlib axes object containing bar containers.
+    """
+    from matplotlib.container import BarContainer
+
+    for container in ax.containers:
+        if not isinstance(container, BarContainer):
+            continue
+        horizontal = container.orientation == "horizontal"
+        for patch, value in zip(container, container.datavalues):
+            if math.isnan(value):
+                continue
+            if horizontal:
+                x = patch.get_x() + patch.get_width()
+                y = patch.get_y() + patch.get_height() / 2
+                ha, va = ("left" if value >= 0 else "right"), "center"
+            else:
+                x = patch.get_x() + patch.get_width() / 2
+                y = patch.get_y() + patch.get_height()
+                ha, va = "center", ("bottom" if value >= 0 else "top")
+            ax.text(x, y, f"{value:g}", ha=ha, va=va, clip_on=False)
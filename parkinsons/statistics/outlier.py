@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.19                                                                              #
+# Python     : 3.10.10                                                                             #
+# Filename   : /parkinsons/statistics/outlier.py                                                   #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Thursday October 15th 2026 10:02:36 am                                              #
+# Modified   : Thursday October 15th 2026 10:02:36 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Outlier Detection Module"""
+import numpy as np
+from numba import njit
+
+
+# ------------------------------------------------------------------------------------------------ #
+@njit(cache=True)
+def _mad_filter(a: np.ndarray, b: float, threshold: float) -> np.ndarray:  # pragma: no cover
+    """Returns the elements of a within threshold scaled MADs of the median.
+
+    Both medians are found by selection rather than sorting. The absolute deviations are
+    computed once and reused for the MAD and the filter, and the survivors are written to an
+    output array of exact length rather than selected by a boolean mask. As with the NumPy
+    formula, input containing NaN or with a MAD of zero leaves no observations.
+
+    Args:
+        a (np.ndarray): One dimensional float64 array.
+        b (float): Constant scaling the MAD to a consistent estimator of the standard deviation.
+        threshold (float): Number of scaled MADs from the median beyond which values are outliers.
+    """
+    n = a.shape[0]
+    if n == 0:
+        return a.copy()
+    median = np.median(a)
+    deviation = np.empty(n)
+    for i in range(n):
+        deviation[i] = abs(a[i] - median)
+    limit = threshold * b * np.median(deviation)
+    count = 0
+    for i in range(n):
+        if deviation[i] < limit:
+            count += 1
+    out = np.empty(count)
+    j = 0
+    for i in range(n):
+        if deviation[i] < limit:
+            out[j] = a[i]
+            j += 1
+    return out
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                            OUTLIER                                               #
+# ------------------------------------------------------------------------------------------------ #
+class Outlier:
+    """Detects univariate outliers using the median absolute deviation (MAD).
+
+    Args:
+        b (float): Constant scaling the MAD to a consistent estimator of the standard deviation
+            of normally distributed data. Defaults to 1.4826.
+        threshold (float): Number of scaled MADs from the median beyond which observations are
+            considered outliers. Defaults to 3.
+    """
+
+    def __init__(self, b: float = 1.4826, threshold: float = 3) -> None:
+        self.__b = b
+        self.__threshold = threshold
+
+    def univariate(self, a: np.ndarray) -> np.ndarray:
+        """Returns the observations in a that are not outliers.
+
+        Args:
+            a (np.ndarray): One dimensional array of observations.
+        """
+        return _mad_filter(np.asarray(a, dtype=np.float64), self.__b, self.__threshold)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.19                                                                              #
+# Python     : 3.10.10                                                                             #
+# Filename   : /tests/test_data/conftest.py                                                        #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday May 20th 2023 07:12:19 pm                                                  #
+# Modified   : Saturday May 20th 2023 07:12:19 pm                                                  #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import numpy as np
+import pandas as pd
+import pytest
+
+
+# ------------------------------------------------------------------------------------------------ #
+@pytest.fixture
+def subjects(tmp_path) -> str:
+    """Writes a subject metadata file with missing UPDRS scores, returning its path."""
+    rng = np.random.default_rng(5)
+    n = 60
+    df = pd.DataFrame(
+        {
+            "Subject": [f"S{i:03d}" for i in range(n)],
+            "Visit": rng.integers(1, 3, n),
+            "Age": rng.integers(50, 80, n),
+            "Sex": rng.choice(["M", "F"], n),
+            "YearsSinceDx": rng.uniform(1, 20, n).round(1),
+            "UPDRSIII_On": rng.integers(0, 60, n).astype(float),
+            "UPDRSIII_Off": rng.integers(0, 60, n).astype(float),
+        }
+    )
+    df.loc[::7, "UPDRSIII_On"] = np.nan
+    filepath = tmp_path / "subjects.csv"
+    df.to_csv(filepath, index=False)
+    return str(filepath)
+
+
+@pytest.fixture
+def pyplot():
+    """Returns pyplot on the non-interactive Agg backend, closing all figures afterwards."""
+    pytest.importorskip("seaborn")
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    yield plt
+    plt.close("all")
+
+
+@pytest.fixture
+def events(tmp_path) -> str:
+    """Writes an event metadata file with fractional times and a missing completion time."""
+    filepath = tmp_path / "events.csv"
+    filepath.write_text(
+        "Id,Init,Completion,Type\n"
+        "a,4978.492,5000.0,Turn\n"
+        "b,10.25,10.753,Walking\n"
+        "c,100.0,NA,Turn\n"
+    )
+    return str(filepath)
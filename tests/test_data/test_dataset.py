@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.19                                                                              #
+# Python     : 3.10.10                                                                             #
+# Filename   : /tests/test_data/test_dataset.py                                                    #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday May 20th 2023 07:12:19 pm                                                  #
+# Modified   : Saturday May 20th 2023 07:12:19 pm                                                  #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+import numpy as np
+import pandas as pd
+from parkinsons.data import base
+from parkinsons.data.base import PERCENTILES, STATISTICS, Dataset, _fast_describe
+
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+# ------------------------------------------------------------------------------------------------ #
+class MetaData(Dataset):
+    """Dataset with no declared dtypes or categorical columns."""
+
+
+def _reference(df: pd.DataFrame) -> pd.DataFrame:
+    return df.describe(percentiles=PERCENTILES).T
+
+
+@pytest.mark.dataset
+class TestDataset:  # pragma: no cover
+    # ============================================================================================ #
+    def test_fast_describe(self, subjects, monkeypatch, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            {
+                "a": rng.normal(size=1000),
+                "b": np.where(rng.random(1000) < 0.2, np.nan, rng.integers(0, 9, 1000)),
+                "c": [1.0] + [np.nan] * 999,
+                "d": [np.nan] * 1000,
+                "e": [2.0, 5.0] + [np.nan] * 998,
+            }
+        )
+        pd.testing.assert_frame_equal(
+            _fast_describe(df), _reference(df), check_names=False, rtol=1e-12
+        )
+        assert list(_fast_describe(df).columns) == STATISTICS
+        # Frames above the row threshold are described by partial sort.
+        monkeypatch.setattr(base, "FAST_DESCRIBE_ROWS", 10)
+        dataset = MetaData(name="subjects", filepath=subjects)
+        pd.testing.assert_frame_equal(
+            dataset.describe(), _reference(dataset._df), check_names=False, rtol=1e-12
+        )
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_read_csv(self, tmp_path, monkeypatch, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        filepath = tmp_path / "missing.csv"
+        filepath.write_text("Id,Score,Note\na,1,x\nb,NA,\nc,3,n/a\nd,n/a,NULL\n")
+        expected = pd.read_csv(filepath)
+        # Missing value tokens are read as by the pandas reader, with or without polars.
+        for polars in (True, False):
+            monkeypatch.setattr(base, "USE_POLARS_IO", polars)
+            df = MetaData(name="missing", filepath=str(filepath))._df
+            assert df["Score"].isna().tolist() == expected["Score"].isna().tolist()
+            assert df["Note"].isna().tolist() == expected["Note"].isna().tolist()
+            np.testing.assert_array_equal(df["Score"].to_numpy(), expected["Score"].to_numpy())
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_downcast(self, subjects, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dataset = MetaData(name="subjects", filepath=subjects)
+        df = pd.read_csv(subjects)
+        # Integers are stored as int32, which is wide enough for arithmetic on them.
+        assert dataset._df["Visit"].dtype == np.int32
+        assert dataset._df["Age"].dtype == np.int32
+        assert (dataset._df["Age"] * 2).tolist() == (df["Age"] * 2).tolist()
+        # Floats keep their precision, so statistics match those of the csv as read by pandas.
+        assert dataset._df["UPDRSIII_On"].dtype == np.float64
+        for column in df.select_dtypes(include="number").columns:
+            np.testing.assert_array_equal(dataset._df[column].to_numpy(), df[column].to_numpy())
+        pd.testing.assert_frame_equal(dataset.describe(), _reference(df), rtol=1e-12)
+        # Only low-cardinality string columns become categories.
+        assert isinstance(dataset._df["Sex"].dtype, pd.CategoricalDtype)
+        assert not isinstance(dataset._df["Subject"].dtype, pd.CategoricalDtype)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_cache_key(self, subjects, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dataset = MetaData(name="subjects", filepath=subjects)
+        groups = dataset._df.groupby(["Sex", "Visit"], observed=True)
+        # List arguments are accepted and cached under the equivalent tuple.
+        expected = groups["Age"].describe(percentiles=PERCENTILES)
+        description = dataset.describe_group(["Sex", "Visit"], column="Age")
+        pd.testing.assert_frame_equal(description.reindex(index=expected.index), expected)
+        assert ("describe_group", ("Sex", "Visit"), "Age", True) in dataset._cache
+        expected = dataset._df.groupby("Sex", observed=True)[["Age", "Visit"]].describe(
+            percentiles=PERCENTILES
+        )
+        description = dataset.describe_group("Sex", column=["Age", "Visit"])
+        pd.testing.assert_frame_equal(description.reindex(index=expected.index), expected)
+        pd.testing.assert_frame_equal(dataset.describe_group("Sex", column=["Age", "Visit"]), description)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_describe_group(self, subjects, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dataset = MetaData(name="subjects", filepath=subjects)
+        for group_by in ("Sex", ["Sex", "Visit"]):
+            groups = dataset._df.groupby(group_by, observed=True)
+            expected = groups.describe(percentiles=PERCENTILES).T
+            description = dataset.describe_group(group_by)
+            pd.testing.assert_frame_equal(
+                description.reindex(columns=expected.columns), expected, check_names=False
+            )
+        groups = dataset._df.groupby("Sex", observed=True)
+        expected = groups["Age"].describe(percentiles=PERCENTILES)
+        description = dataset.describe_group("Sex", column="Age")
+        pd.testing.assert_frame_equal(description.reindex(index=expected.index), expected)
+        average = dataset.describe_group("Sex", column="Age", verbose=False)
+        assert list(average.columns) == ["Average"]
+        assert average.loc["F", "Average"] == "{} ± {}".format(
+            round(expected.loc["F", "mean"], 1), round(expected.loc["F", "std"], 1)
+        )
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_cache(self, subjects, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dataset = MetaData(name="subjects", filepath=subjects)
+        # Results are copies, so modifying one does not alter the cache.
+        average = dataset.describe(verbose=False)
+        average["Average"] = "x"
+        assert (dataset.describe(verbose=False)["Average"] != "x").all()
+        assert dataset.info()["Valid"].max() == 60
+        # Replacing the frame invalidates the cache, even with one of the same shape.
+        dataset._df = dataset._df.iloc[:20]
+        assert dataset.info()["Valid"].max() == 20
+        replaced = dataset._df.copy()
+        replaced["YearsSinceDx"] = np.nan
+        dataset._df = replaced
+        assert dataset.info().set_index("Column").loc["YearsSinceDx", "Valid"] == 0
+        # Values modified in place require an explicit reset.
+        dataset._df.loc[:, "UPDRSIII_Off"] = np.nan
+        assert dataset.info().set_index("Column").loc["UPDRSIII_Off", "Valid"] == 20
+        dataset.reset()
+        assert dataset.info().set_index("Column").loc["UPDRSIII_Off", "Valid"] == 0
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_describe_numba(self, subjects, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        pytest.importorskip("numba")
+        dataset = MetaData(name="subjects", filepath=subjects)
+        pd.testing.assert_frame_equal(
+            dataset.describe(engine="numba"), _reference(dataset._df), check_names=False, rtol=1e-12
+        )
+        # Small samples, including a column with a single valid value.
+        dataset._df = dataset._df.iloc[:2]
+        pd.testing.assert_frame_equal(
+            dataset.describe(engine="numba"), _reference(dataset._df), check_names=False, rtol=1e-12
+        )
+        # Non-numeric columns are summarized as count, unique, top and freq by both engines.
+        description = dataset.describe(column="Sex", engine="numba")
+        pd.testing.assert_frame_equal(description, dataset.describe(column="Sex"))
+        assert list(description.columns) == ["count", "unique", "top", "freq"]
+        with pytest.raises(ValueError):
+            dataset.describe(engine="nmba")
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
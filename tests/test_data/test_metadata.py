@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.19                                                                              #
+# Python     : 3.10.10                                                                             #
+# Filename   : /tests/test_data/test_metadata.py                                                   #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday May 20th 2023 07:12:19 pm                                                  #
+# Modified   : Saturday May 20th 2023 07:12:19 pm                                                  #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+import numpy as np
+import pandas as pd
+from parkinsons.data.metadata import DailyLiving, DeFOG, Event, Subject, Task, TDCSFoG
+
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.metadata
+class TestMetadata:  # pragma: no cover
+    # ============================================================================================ #
+    def test_updrs_refresh(self, subjects, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        subject = Subject(name="subjects", filepath=subjects)
+        assert len(subject._updrs_slice("Sex", "F")) == 2 * (subject._df["Sex"] == "F").sum()
+        # Replacing the frame rebuilds the UPDRS scores and their splits, with or without a cached
+        # method having run first.
+        subject._df = subject._df.iloc[:20]
+        assert len(subject.updrs) == 40
+        assert len(subject._updrs_slice("Sex", "F")) == 2 * (subject._df["Sex"] == "F").sum()
+        # Values modified in place are picked up after a reset.
+        arguments = {"column": "Score", "filter_var": "Sex", "filter_val": "F"}
+        counts = subject.describe_updrs(group_var="Instrument", **arguments)["count"]
+        subject._df.loc[:, "UPDRSIII_Off"] = np.nan
+        subject.reset()
+        updated = subject.describe_updrs(group_var="Instrument", **arguments)["count"]
+        assert updated.sum() < counts.sum()
+        assert subject._updrs_slice("Instrument", "UPDRSIII_Off")["Score"].isna().all()
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_updrs(self, subjects, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        subject = Subject(name="subjects", filepath=subjects)
+        expected = pd.melt(
+            subject._df[["Subject", "Visit", "Sex", "YearsSinceDx", "UPDRSIII_Off", "UPDRSIII_On"]],
+            id_vars=["Subject", "Visit", "Sex", "YearsSinceDx"],
+            value_vars=["UPDRSIII_Off", "UPDRSIII_On"],
+            var_name="Instrument",
+            value_name="Score",
+        )
+        # Rows, columns and their order match pd.melt. Instrument is stored as a category.
+        updrs = subject.updrs
+        assert updrs["Instrument"].cat.categories.tolist() == ["UPDRSIII_Off", "UPDRSIII_On"]
+        assert updrs["Score"].dtype == expected["Score"].dtype
+        pd.testing.assert_frame_equal(
+            updrs.astype({"Instrument": expected["Instrument"].dtype}), expected
+        )
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_duration(self, events, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # Durations keep the precision of the float timing columns.
+        event = Event(name="events", filepath=events)
+        assert event._df["Duration"].dtype == np.float64
+        np.testing.assert_array_equal(
+            event._df["Duration"].to_numpy(), [5000.0 - 4978.492, 10.753 - 10.25, np.nan]
+        )
+        assert isinstance(event._df["Type"].dtype, pd.CategoricalDtype)
+        # Integer columns are subtracted in int64, so narrow types cannot overflow.
+        filepath = tmp_path / "tasks.csv"
+        filepath.write_text("Id,Begin,End\na,0,2000000000\nb,-2000000000,2000000000\n")
+        task = Task(name="tasks", filepath=str(filepath))
+        assert task._df["Duration"].dtype == np.int64
+        assert task._df["Duration"].tolist() == [2000000000, 4000000000]
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_dtypes(self, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        filepath = tmp_path / "tdcsfog.csv"
+        filepath.write_text("Id,Subject,Visit,Test,Medication\na,S1,1,1,on\nb,S1,2,3,off\n")
+        tdcsfog = TDCSFoG(name="tdcsfog", filepath=str(filepath))
+        assert tdcsfog._df.dtypes[["Visit", "Test"]].tolist() == [np.int32, np.int32]
+        defog = DeFOG(name="defog", filepath=str(filepath))
+        assert defog._df["Visit"].dtype == np.int32
+        # Undeclared columns are left to the downcast, which also stops at int32.
+        daily = DailyLiving(name="daily", filepath=str(filepath))
+        assert daily._df["Test"].dtype == np.int32
+        assert daily._df["Id"].tolist() == ["a", "b"]
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_updrs_slice(self, subjects, pyplot, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        subject = Subject(name="subjects", filepath=subjects)
+        updrs = subject.updrs
+        # Splits by sex and instrument match boolean masks. Other filters fall back to a mask.
+        for var, val in [("Sex", "M"), ("Sex", "F"), ("Instrument", "UPDRSIII_On"), ("Visit", 2)]:
+            pd.testing.assert_frame_equal(
+                subject._updrs_slice(var, val), updrs.loc[updrs[var] == val], check_categorical=False
+            )
+        assert subject._updrs_slice("Sex", "X").empty
+        subject.updrs_gender()
+        subject.updrs_med()
+        titles = [[ax.get_title() for ax in fig.axes] for fig in map(pyplot.figure, pyplot.get_fignums())]
+        assert titles == [
+            ["Female Subjects", "Male Subjects"],
+            ["Off Medication", "On Medication"],
+        ]
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
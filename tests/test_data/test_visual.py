@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.19                                                                              #
+# Python     : 3.10.10                                                                             #
+# Filename   : /tests/test_data/test_visual.py                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday May 20th 2023 07:12:19 pm                                                  #
+# Modified   : Saturday May 20th 2023 07:12:19 pm                                                  #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import subprocess
+import sys
+import pytest
+import logging
+import numpy as np
+from parkinsons.data.metadata import Subject
+from parkinsons.data.visual import Canvas, Config, label_bars
+from tests.test_data.test_dataset import MetaData
+
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.visual
+class TestVisual:  # pragma: no cover
+
+    # ============================================================================================ #
+    def test_label_bars(self, subjects, pyplot, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dataset = MetaData(name="subjects", filepath=subjects)
+        ax = dataset.countplot(x="Sex")
+        counts = dataset._df["Sex"].value_counts()
+        assert sorted(int(text.get_text()) for text in ax.texts) == sorted(counts.tolist())
+        # Labels sit at the end of each bar, on the side the bar extends to. NaN bars are skipped.
+        values = [3.0, -2.0, np.nan]
+        _, ax = pyplot.subplots()
+        ax.bar(["a", "b", "c"], values)
+        label_bars(ax)
+        assert [text.get_text() for text in ax.texts] == ["3", "-2"]
+        assert [text.get_position()[1] for text in ax.texts] == [3.0, -2.0]
+        assert [text.get_va() for text in ax.texts] == ["bottom", "top"]
+        _, ax = pyplot.subplots()
+        ax.barh(["a", "b", "c"], values)
+        ax.errorbar([0.0], [1.0], xerr=[0.5])
+        label_bars(ax)
+        assert [text.get_position()[0] for text in ax.texts] == [3.0, -2.0]
+        assert [text.get_ha() for text in ax.texts] == ["left", "right"]
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_canvas(self, pyplot, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # The figure is created on first access and reused afterwards.
+        canvas = Canvas()
+        assert canvas._fig is None
+        ax = canvas.ax
+        assert canvas.fig is ax.figure
+        assert canvas.ax is ax
+        assert tuple(canvas.fig.get_size_inches()) == Config.figsize
+        # Grids scale the figure height by the number of rows.
+        canvas = Canvas(nrows=2, ncols=3)
+        assert canvas.axs.shape == (2, 3)
+        assert canvas.ax is None
+        assert tuple(canvas.fig.get_size_inches()) == (Config.figsize[0], Config.figsize[1] * 2)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_lazy_import(self, subjects, pyplot, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # Tabular methods leave matplotlib and seaborn unimported.
+        script = (
+            "import sys\n"
+            "from parkinsons.data.metadata import Subject\n"
+            f"subject = Subject(name='subjects', filepath={subjects!r})\n"
+            "subject.head(), subject.sample(), subject.info(), subject.describe()\n"
+            "assert not {'matplotlib', 'seaborn'} & set(sys.modules)\n"
+        )
+        subprocess.run([sys.executable, "-c", script], check=True)
+        subject = Subject(name="subjects", filepath=subjects)
+        assert subject.head(3).equals(subject._df.iloc[:3])
+        assert len(subject.sample(n=4, random_state=0)) == 4
+        # Plotting methods import them, and apply the style, on first use.
+        subject.histogram(x="Age", grouping="Sex", title="Age")
+        assert subject.histplot(x="Age", hue="Sex", multiple="stack").get_title() == "Age by Sex"
+        assert subject.boxplot(x="Sex", y="Age").get_title() == "Sex"
+        assert subject.barplot(x="Sex", y="Age", hue="Visit").get_title() == "Sex by Visit"
+        assert len(pyplot.get_fignums()) == 4
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
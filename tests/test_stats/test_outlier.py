@@ -46,15 +46,23 @@ class TestOutlier:  # pragma: no cover
         )
         logger.info(double_line)
         # ---------------------------------------------------------------------------------------- #
-        a = np.random.randint(1, 200, 200)
-        med = np.median(a)
-        centered = np.abs(a - med)
-        median = np.median(centered)
-        mad = median * 1.4826
-        b = a[np.abs((a - median) / mad) < 3]
         outlier = Outlier()
-        c = outlier.univariate(a)
-        assert b.all() == c.all()
+        rng = np.random.default_rng(1)
+        samples = [
+            rng.integers(1, 200, 200),
+            np.concatenate([rng.normal(size=500), [25.0, -40.0]]),
+            np.array([1.0, 2.0, np.nan, 3.0]),
+            np.array([5.0, 5.0, 5.0, 9.0]),
+            np.array([]),
+        ]
+        for a in samples:
+            med = np.median(a) if a.size else np.nan
+            mad = np.median(np.abs(a - med)) if a.size else np.nan
+            with np.errstate(divide="ignore", invalid="ignore"):
+                b = a[np.abs(a - med) / (1.4826 * mad) < 3]
+            c = outlier.univariate(a)
+            assert np.array_equal(b, c)
+        assert not np.isin([25.0, -40.0], outlier.univariate(samples[1])).any()
 
         # ---------------------------------------------------------------------------------------- #
         end = datetime.now()